@@ -72,10 +72,8 @@ def main():  # noqa: C901
         args.plotFile = os.path.join(inputFileFolder, inputFileName + "-plot.png")
 
     # read time series file to pandas DataFrame
-    data = pd.read_csv(
-        args.timeSeriesFile, index_col='time',
-        parse_dates=['time'], date_parser=utils.date_parser
-    )
+    data = pd.read_csv(args.timeSeriesFile, index_col='time')
+    data.index = utils.date_parser(data.index)
 
     # set backend if run from main
     matplotlib.use('Agg')
@@ -1,18 +1,15 @@
 """Command line tool to extract meaningful health info from accelerometer data."""
 
-import accelerometer.utils
-import accelerometer.classification
 import argparse
 import collections
 import datetime
-import accelerometer.device
 import json
 import os
-import accelerometer.summarisation
-import pandas as pd
 import atexit
 import warnings
 
+TRUE_STRS = frozenset(("yes", "true", "t", "1"))
+
 
 def main():  # noqa: C901
     """
@@ -102,7 +99,7 @@ def main():  # noqa: C901
                              : %(default)s, must be an integer)""")
     parser.add_argument('--csvTimeXYZTempColsIndex',
                         metavar='time,x,y,z,temperature',
-                        default="0,1,2,3,4", type=str,
+                        default="0,1,2,3,4", type=str2ints,
                         help="""index of column positions for time
                             and x/y/z/temperature columns, e.g. "0,1,2,3,4" (default
                              : %(default)s)""")
@@ -110,12 +107,14 @@ def main():  # noqa: C901
     parser.add_argument('--rawOutput',
                         metavar='True/False', default=False, type=str2bool,
                         help="""output calibrated and resampled raw data to
-                            a .csv.gz file? NOTE: requires ~50MB per day.
+                            a .csv.gz file? Values are integer milli-g, see
+                            the -rawInfo.json file. NOTE: requires ~40MB per day.
                             (default : %(default)s)""")
     parser.add_argument('--npyOutput',
                         metavar='True/False', default=False, type=str2bool,
                         help="""output calibrated and resampled raw data to
-                            .npy file? NOTE: requires ~60MB per day.
+                            .npy file? Values are int16 milli-g, see the
+                            -rawInfo.json file. NOTE: requires ~50MB per day.
                             (default : %(default)s)""")
     # calibration parameters
     parser.add_argument('--skipCalibration',
@@ -205,6 +204,12 @@ def main():  # noqa: C901
                         metavar='True/False', default=True, type=str2bool,
                         help="""True will remove extra "helper" files created
                                     by the program (default : %(default)s)""")
+    parser.add_argument('--fastEpoch',
+                        metavar='True/False', default=False, type=str2bool,
+                        help="""True will write the intermediate epoch file
+                            uncompressed (.csv instead of .csv.gz). Faster to
+                            write and read back, but takes more disk space
+                            (default : %(default)s)""")
     # calling helper processess and conducting multi-threadings
     parser.add_argument('--rawDataParser',
                         metavar="rawDataParser", default="AccelerometerParser",
@@ -220,6 +225,12 @@ def main():  # noqa: C901
 
     args = parser.parse_args()
 
+    # Deferred until after argument parsing so that --help and invalid
+    # arguments return without loading pandas/numpy
+    import accelerometer.utils
+    import accelerometer.device
+    import accelerometer.summarisation
+
     processingStartTime = datetime.datetime.now()
 
     if args.calOffset != [0, 0, 0] or args.calSlope != [1, 1, 1] or args.calTemp != [0, 0, 0]:
@@ -261,25 +272,28 @@ def main():  # noqa: C901
     # Set default output filenames
     args.summaryFile = os.path.join(args.outputFolder, inputFileName + "-summary.json")
     args.nonWearFile = os.path.join(args.outputFolder, inputFileName + "-nonWearBouts.csv.gz")
-    args.epochFile = os.path.join(args.outputFolder, inputFileName + "-epoch.csv.gz")
+    if args.fastEpoch:
+        args.epochFile = os.path.join(args.outputFolder, inputFileName + "-epoch.csv")
+    else:
+        args.epochFile = os.path.join(args.outputFolder, inputFileName + "-epoch.csv.gz")
     args.stationaryFile = os.path.join(args.outputFolder, inputFileName + "-stationaryPoints.csv.gz")
     args.tsFile = os.path.join(args.outputFolder, inputFileName + "-timeSeries.csv.gz")
     args.rawFile = os.path.join(args.outputFolder, inputFileName + ".csv.gz")
     args.npyFile = os.path.join(args.outputFolder, inputFileName + ".npy")  # .gz?
+    args.rawInfoFile = os.path.join(args.outputFolder, inputFileName + "-rawInfo.json")
 
     # Schedule to delete intermediate files at program exit
     if args.deleteIntermediateFiles:
         @atexit.register
         def deleteIntermediateFiles():
-            try:
-                if os.path.exists(args.stationaryFile):
-                    os.remove(args.stationaryFile)
-                if os.path.exists(args.nonWearFile):
-                    os.remove(args.nonWearFile)
-                if os.path.exists(args.epochFile):
-                    os.remove(args.epochFile)
-            except OSError:
-                accelerometer.utils.toScreen('Could not delete intermediate files')
+            # One remove() per file; a missing file is not an error
+            for intermediateFile in (args.stationaryFile, args.nonWearFile, args.epochFile):
+                try:
+                    os.remove(intermediateFile)
+                except FileNotFoundError:
+                    pass
+                except OSError:
+                    accelerometer.utils.toScreen(f"Could not delete intermediate file '{intermediateFile}'")
 
     # Check user-specified end time is not before start time
     if args.startTime and args.endTime:
@@ -314,10 +328,11 @@ def main():  # noqa: C901
             extractFeatures=args.extractFeatures,
             rawOutput=args.rawOutput, rawFile=args.rawFile,
             npyOutput=args.npyOutput, npyFile=args.npyFile,
+            rawInfoFile=args.rawInfoFile,
             startTime=args.startTime, endTime=args.endTime, verbose=args.verbose,
             csvStartTime=args.csvStartTime, csvSampleRate=args.csvSampleRate,
             csvTimeFormat=args.csvTimeFormat, csvStartRow=args.csvStartRow,
-            csvTimeXYZTempColsIndex=list(map(int, args.csvTimeXYZTempColsIndex.split(',')))
+            csvTimeXYZTempColsIndex=args.csvTimeXYZTempColsIndex
         )
     else:
         summary['file-name'] = args.epochFile
@@ -365,7 +380,15 @@ def str2bool(v):
     Used to parse true/false values from the command line. E.g. "True" -> True
     """
 
-    return v.lower() in ("yes", "true", "t", "1")
+    return v.lower() in TRUE_STRS
+
+
+def str2ints(v):
+    """
+    Used to parse comma separated integers from the command line. E.g. "0,1,2,3,4" -> (0, 1, 2, 3, 4)
+    """
+
+    return tuple(int(i) for i in v.split(','))
 
 
 def str2date(v):
@@ -374,25 +397,10 @@ def str2date(v):
     """
 
     eg = "1994-11-30T12:00"  # example date
-    if v.count("-") != eg.count("-"):
-        print("ERROR: Not enough dashes in date")
-    elif v.count("T") != eg.count("T"):
-        print("ERROR: No T seperator in date")
-    elif v.count(":") != eg.count(":"):
-        print("ERROR: No ':' seperator in date")
-    elif len(v.split("-")[0]) != 4:
-        print("ERROR: Year in date must be 4 numbers")
-    elif len(v.split("-")[1]) != 2 and len(v.split("-")[1]) != 1:
-        print("ERROR: Month in date must be 1-2 numbers")
-    elif len(v.split("-")[2].split("T")[0]) != 2 and len(v.split("-")[2].split("T")[0]) != 1:
-        print("ERROR: Day in date must be 1-2 numbers")
-    else:
-        return pd.datetime.strptime(v, "%Y-%m-%dT%H:%M")
-    print("Please change your input date:")
-    print('"' + v + '"')
-    print("to match the example date format:")
-    print('"' + eg + '"')
-    raise ValueError("Date in incorrect format")
+    try:
+        return datetime.datetime.strptime(v, "%Y-%m-%dT%H:%M")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"date {v!r} must match the example date format {eg!r}")
 
 
 if __name__ == '__main__':
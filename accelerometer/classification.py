@@ -13,7 +13,7 @@ import sklearn.metrics as metrics
 from sklearn.metrics import confusion_matrix
 import joblib
 import tarfile
-import urllib
+import urllib.request
 import pathlib
 import shutil
 import warnings
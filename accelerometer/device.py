@@ -2,10 +2,10 @@
 
 from accelerometer import utils
 import gzip
+import json
 import numpy as np
 import os
 import pandas as pd
-import statsmodels.api as sm
 import struct
 from subprocess import call
 import sys
@@ -23,6 +23,7 @@ def processInputFileToEpoch(  # noqa: C901
     useFilter=True, sampleRate=100, resampleMethod="linear", epochPeriod=30,
     extractFeatures=True,
     rawOutput=False, rawFile=None, npyOutput=False, npyFile=None,
+    rawInfoFile=None,
     startTime=None, endTime=None,
     verbose=False,
     csvStartTime=None, csvSampleRate=None,
@@ -38,7 +39,7 @@ def processInputFileToEpoch(  # noqa: C901
         to <epochFile> from <inputFile>
 
     :param str inputFile: Input <cwa/cwa.gz/bin/gt3x> raw accelerometer file
-    :param str epochFile: Output csv.gz file of processed epoch data
+    :param str epochFile: Output .csv.gz (or uncompressed .csv) file of processed epoch data
     :param str stationaryFile: Output/temporary file for calibration
     :param dict summary: Output dictionary containing all summary metrics
     :param bool skipCalibration: Perform software calibration (process data twice)
@@ -55,11 +56,12 @@ def processInputFileToEpoch(  # noqa: C901
     :param int epochPeriod: Size of epoch time window (in seconds)
     :param bool activityClassification: Extract features for machine learning
     :param bool rawOutput: Output calibrated and resampled raw data to a .csv.gz
-        file? requires ~50MB/day.
+        file? requires ~40MB/day. Values are stored as integer milli-g.
     :param str rawFile: Output raw data ".csv.gz" filename
     :param bool npyOutput: Output calibrated and resampled raw data to a .npy
-        file? requires ~60MB/day.
+        file? requires ~50MB/day. Values are stored as int16 milli-g.
     :param str npyFile: Output raw data ".npy" filename
+    :param str rawInfoFile: Output ".json" file describing the raw data encoding
     :param datetime startTime: Remove data before this time in analysis
     :param datetime endTime: Remove data after this time in analysis
     :param bool verbose: Print verbose output
@@ -67,7 +69,8 @@ def processInputFileToEpoch(  # noqa: C901
     :param float csvSampleRate: sample rate for csv file when time column is not available
     :param str csvTimeFormat: time format for csv file when time column is available
     :param int csvStartRow: start row for accelerometer data in csv file
-    :param str csvTimeXYZTempColsIndex: index of column positions for XYZT columns, e.g. "1,2,3,0"
+    :param tuple(int) csvTimeXYZTempColsIndex: index of column positions for time/x/y/z/temperature
+        columns, e.g. (0, 1, 2, 3, 4)
 
     :return: Raw processing summary values written to dict <summary>
     :rtype: void
@@ -184,6 +187,10 @@ def processInputFileToEpoch(  # noqa: C901
             print(commandArgs)
             print("Error: Java epoch generation failed, exit ", exitCode)
             sys.exit(-7)
+        if (rawOutput or npyOutput) and rawInfoFile:
+            writeRawInfo(rawInfoFile, sampleRate,
+                         rawFile=rawFile if rawOutput else None,
+                         npyFile=npyFile if npyOutput else None)
 
     else:
         if not skipCalibration:
@@ -213,6 +220,41 @@ def processInputFileToEpoch(  # noqa: C901
         getOmconvertInfo(stationaryFile, summary)
 
 
+def writeRawInfo(rawInfoFile, sampleRate, rawFile=None, npyFile=None):
+    """Write description of the raw output encoding to a .json sidecar file
+
+    The java parser stores calibrated raw x/y/z values as integers in milli-g,
+    in both the .csv.gz and the .npy file. Multiply by 'scale(g)' to recover
+    g units. Each written file is listed under 'files' with its format, and
+    the .npy entry also gives the numpy dtype of the x/y/z fields.
+
+    :param str rawInfoFile: Output .json filename
+    :param int sampleRate: Sample rate (Hz) of the resampled raw data
+    :param str rawFile: Raw data ".csv.gz" filename, if written
+    :param str npyFile: Raw data ".npy" filename, if written
+
+    :return: Raw data encoding written to <rawInfoFile>
+    :rtype: void
+    """
+
+    files = {}
+    if rawFile:
+        files[os.path.basename(rawFile)] = {'format': 'csv'}
+    if npyFile:
+        # the java NpyWriter gzips the .npy file on close
+        files[os.path.basename(npyFile) + '.gz'] = {'format': 'npy', 'dtype': 'int16'}
+
+    rawInfo = {
+        'units': 'mg',
+        'scale(g)': 0.001,
+        'missingValue': -32768,  # NaN samples
+        'sampleRate(Hz)': sampleRate,
+        'files': files,
+    }
+    with open(rawInfoFile, 'w') as f:
+        json.dump(rawInfo, f, indent=4)
+
+
 def getCalibrationCoefs(staticBoutsFile, summary):
     """Identify calibration coefficients from java processed file
 
@@ -273,21 +315,25 @@ def getCalibrationCoefs(staticBoutsFile, summary):
 
     else:  # we do have enough uniformly distributed points
 
+        # Design matrix [1, curr, T]. Only the middle column changes per axis
+        inp = np.column_stack((np.ones(nStatic), np.empty(nStatic), T))
+
         for it in range(MAXITER):
 
             # Weighting. Outliers are zeroed out
             # This is different from the paper
             maxerr = np.quantile(errors, .995)
             weights = np.maximum(1 - errors / maxerr, 0)
+            sqrtWeights = np.sqrt(weights)
 
             # Optimize params for each axis
             for k in range(3):
 
-                inp = curr[:, k]
-                out = target[:, k]
-                inp = np.column_stack((inp, T))
-                inp = sm.add_constant(inp, prepend=True, has_constant='add')
-                params = sm.WLS(out, inp, weights=weights).fit().params
+                # Weighted least squares of target ~ 1 + curr + T, solved
+                # directly on the sqrt(weights)-scaled design matrix
+                inp[:, 1] = curr[:, k]
+                out = target[:, k] * sqrtWeights
+                params = np.linalg.lstsq(inp * sqrtWeights[:, None], out, rcond=None)[0]
                 # In the following,
                 # intercept == params[0]
                 # slope == params[1]
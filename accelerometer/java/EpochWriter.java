@@ -21,9 +21,9 @@ public class EpochWriter {
 
 	private static final DecimalFormatSymbols decimalFormatSymbol = new DecimalFormatSymbols(Locale.ENGLISH);
 	private static DecimalFormat DF6 = new DecimalFormat("0.000000", decimalFormatSymbol);
-	private static DecimalFormat DF3 = new DecimalFormat("0.000", decimalFormatSymbol);
 	private static DecimalFormat DF2 = new DecimalFormat("0.00", decimalFormatSymbol);
 	private final long UNUSED_DATE = -1;
+	private static final short MISSING_MILLI_G = Short.MIN_VALUE; // raw output value for NaN
 
 	// Storage variables setup:
 	// store x/y/z values to pass into epochWriter
@@ -108,11 +108,9 @@ public class EpochWriter {
 		decimalFormatSymbol.setNaN("NaN");
 		decimalFormatSymbol.setInfinity("inf");
 		DF6.setDecimalFormatSymbols(decimalFormatSymbol);
-		DF3.setDecimalFormatSymbols(decimalFormatSymbol);
 		DF2.setDecimalFormatSymbols(decimalFormatSymbol);
 
 		DF6.setRoundingMode(RoundingMode.CEILING);
-		DF3.setRoundingMode(RoundingMode.HALF_UP); // To match mHealth Gt3x implementation
         DF2.setRoundingMode(RoundingMode.CEILING);
 
 		String epochHeader = "time";
@@ -337,14 +335,15 @@ public class EpochWriter {
         }
 
 		//write out raw values ...
+		// Note: raw values are stored as integer milli-g (see toMilliG)
 		if (rawWriter != null) {
 			for (int i = 0; i < xResampled.length; i++) {
 				writeLine(
                     rawWriter,
                     timeFormat.format(epochStartTime.plus(timeResampled[i], ChronoUnit.MILLIS))
-                    + "," + DF3.format(xResampled[i])
-                    + "," + DF3.format(yResampled[i])
-                    + "," + DF3.format(zResampled[i]));
+                    + "," + toMilliG(xResampled[i])
+                    + "," + toMilliG(yResampled[i])
+                    + "," + toMilliG(zResampled[i]));
 			}
         }
 		if (npyWriter!=null) {
@@ -406,13 +405,24 @@ public class EpochWriter {
         }
 
         try {
-            npyWriter.writeData(time, (float) x, (float) y, (float) z);
+            npyWriter.writeData(time, toMilliG(x), toMilliG(y), toMilliG(z));
         } catch (Exception excep) {
             System.err.println("line write error: " + excep.toString());
         }
     }
 
 
+    // Quantize a calibrated value in g to integer milli-g. Values are already
+    // clipped to the device range, the clamp only guards the short cast.
+    // NaN has no integer representation and is stored as MISSING_MILLI_G.
+    private static short toMilliG(double g) {
+        if (Double.isNaN(g)) {
+            return MISSING_MILLI_G;
+        }
+        return (short) Math.max(-Short.MAX_VALUE, Math.min(Short.MAX_VALUE, Math.rint(g * 1000)));
+    }
+
+
 	public void closeWriters(){
 		try{
 			epochFileWriter.close();
@@ -31,7 +31,7 @@ public class NpyWriter {
 
 	// buffer file output so it's faster
 	private int bufferLength = 1000; // number of lines to buffer
-	private int bytesPerLine = (Long.BYTES + Float.BYTES * 3);
+	private int bytesPerLine = (Long.BYTES + Short.BYTES * 3);
 	private ByteOrder nativeByteOrder = ByteOrder.nativeOrder();
 	private char numpyByteOrder = nativeByteOrder==ByteOrder.BIG_ENDIAN ? '>' : '<';
 	private ByteBuffer lineBuffer = ByteBuffer.allocate(bufferLength * bytesPerLine).order(nativeByteOrder);
@@ -57,9 +57,9 @@ public class NpyWriter {
 			String filler = new String(new char[HEADER_SIZE + hdrLen]).replace("\0", " ") +"\n";
 			raf.writeBytes(filler);
 			itemTypes.add(Long.class); itemNames.add("time");
-			itemTypes.add(Float.class);itemNames.add("x");
-			itemTypes.add(Float.class);itemNames.add("y");
-			itemTypes.add(Float.class);itemNames.add("z");
+			itemTypes.add(Short.class);itemNames.add("x");
+			itemTypes.add(Short.class);itemNames.add("y");
+			itemTypes.add(Short.class);itemNames.add("z");
 
 		} catch (IOException e) {
 			throw new RuntimeException("The .npy file " + outputFile +" could not be created");
@@ -67,11 +67,11 @@ public class NpyWriter {
 	}
 
 
-	public void writeData(long time, Float x, Float y, Float z) throws IOException {
+	public void writeData(long time, short x, short y, short z) throws IOException {
 		lineBuffer.putLong(time);
-		lineBuffer.putFloat(x);
-		lineBuffer.putFloat(y);
-		lineBuffer.putFloat(z);
+		lineBuffer.putShort(x);
+		lineBuffer.putShort(y);
+		lineBuffer.putShort(z);
 		if (!lineBuffer.hasRemaining()) {
 			raf.write(lineBuffer.array());
 			lineBuffer.clear();
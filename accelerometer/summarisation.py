@@ -31,7 +31,7 @@ def getActivitySummary(  # noqa: C901
     6) calculate empirical cumulative distribution function of vector magnitudes
     7) derive main movement summaries (overall, weekday/weekend, and hour)
 
-    :param str epochFile: Input csv.gz file of processed epoch data
+    :param str epochFile: Input .csv.gz (or uncompressed .csv) file of processed epoch data
     :param str nonWearFile: Output filename for non wear .csv.gz episodes
     :param dict summary: Output dictionary containing all summary metrics
     :param bool activityClassification: Perform machine learning of activity states
@@ -76,7 +76,8 @@ def getActivitySummary(  # noqa: C901
     if isinstance(epochFile, pd.DataFrame):
         data = epochFile
     else:
-        data = pd.read_csv(epochFile, index_col=['time'], parse_dates=['time'], date_parser=utils.date_parser)
+        data = pd.read_csv(epochFile, index_col=['time'])
+        data.index = utils.date_parser(data.index)
 
     # Remove data before/after user specified start/end times
     rows = data.shape[0]
@@ -259,17 +260,19 @@ def imputeMissing(data, extrapolate=True):
             tolerance=pd.Timedelta('1m'),
             limit=1)
 
+    # Fill with group means computed by the built-in (cythonized) groupby
+    # aggregation rather than a Python lambda called once per group
+    def fillGroupMean(data, by):
+        return data.fillna(data.groupby(by).transform('mean'))
+
     data = (
         data
         # first attempt imputation using same day of week
-        .groupby([data.index.weekday, data.index.hour, data.index.minute])
-        .transform(lambda x: x.fillna(x.mean()))
+        .pipe(fillGroupMean, [data.index.weekday, data.index.hour, data.index.minute])
         # then try within weekday/weekend
-        .groupby([data.index.weekday >= 5, data.index.hour, data.index.minute])
-        .transform(lambda x: x.fillna(x.mean()))
+        .pipe(fillGroupMean, [data.index.weekday >= 5, data.index.hour, data.index.minute])
         # finally, use all other days
-        .groupby([data.index.hour, data.index.minute])
-        .transform(lambda x: x.fillna(x.mean()))
+        .pipe(fillGroupMean, [data.index.hour, data.index.minute])
     )
 
     return data
@@ -367,20 +367,46 @@ def date_parser(t):
     '''
     Parse date a date string of the form e.g.
     2020-06-14 19:01:15.123+0100 [Europe/London]
+
+    A column of such strings (e.g. the epoch file 'time' column) is parsed
+    in one vectorised call and returned as a DatetimeIndex. All entries are
+    assumed to share the timezone of the first entry, as written by the
+    java parser.
     '''
-    tz = re.search(r'(?<=\[).+?(?=\])', t)
+    if isinstance(t, str):
+        tz = re.search(r'(?<=\[).+?(?=\])', t)
+        if tz is not None:
+            tz = tz.group()
+        t = re.sub(r'\[(.*?)\]', '', t)
+        return pd.to_datetime(t, utc=True).tz_convert(tz)
+
+    t = pd.Series(t, dtype='str')
+    tz = re.search(r'(?<=\[).+?(?=\])', t.iloc[0]) if len(t) > 0 else None
     if tz is not None:
         tz = tz.group()
-    t = re.sub(r'\[(.*?)\]', '', t)
-    return pd.to_datetime(t, utc=True).tz_convert(tz)
+    t = t.str.replace(r'\s*\[(.*?)\]', '', regex=True)
+    return pd.DatetimeIndex(pd.to_datetime(t, utc=True), name='time').tz_convert(tz)
 
 
 def date_strftime(t):
     '''
     Convert to time format of the form e.g.
     2020-06-14 19:01:15.123+0100 [Europe/London]
+
+    Also accepts a DatetimeIndex, which is formatted without a per-timestamp
+    python loop.
     '''
     tz = t.tz
+    if isinstance(t, pd.DatetimeIndex):
+        if tz is None:  # %z is empty for tz-naive timestamps
+            return pd.Index(t.strftime('%Y-%m-%d %H:%M:%S.%f') + f' [{tz}]', name=t.name)
+        # %z forces strftime to format each timestamp in python, so format the
+        # local wall time and the UTC offset (+HHMM) separately
+        local = t.tz_localize(None)
+        offset = pd.Series((local - t.tz_convert(None)) // pd.Timedelta('1min'))
+        sign = offset.lt(0).map({True: '-', False: '+'})
+        hhmm = (offset.abs() // 60 * 100 + offset.abs() % 60).astype(str).str.zfill(4)
+        return pd.Index(local.strftime('%Y-%m-%d %H:%M:%S.%f') + sign + hhmm + f' [{tz}]', name=t.name)
     return t.strftime(f'%Y-%m-%d %H:%M:%S.%f%z [{tz}]')
 
 
@@ -405,6 +431,6 @@ def writeTimeSeries(e, labels, tsFile):
 
     # make output time format contain timezone
     # e.g. 2020-06-14 19:01:15.123000+0100 [Europe/London]
-    e.index = e.index.to_series().apply(date_strftime)
+    e.index = date_strftime(e.index)
 
     e.to_csv(tsFile, compression='gzip')
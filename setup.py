@@ -36,7 +36,6 @@ setuptools.setup(
         'matplotlib',
         'pandas>=1.2.5',
         'tqdm>=4.59.0',
-        'statsmodels>=0.12.2',
         'imbalanced-learn==0.8.1',
         'scikit-learn==1.0.1',
         'joblib==1.1.0',